@@ -4,24 +4,132 @@ This example shows how to create two LangChain agents:
   2. A reasoning agent based on OpenAI’s o3-mini llm.
 They interact in a loop, each contributing to the final collaborative solution.
 
+Requires httpx; install it as httpx[http2] (which adds the h2 package) to talk HTTP/2.
+Without h2 the client falls back to HTTP/1.1 keep-alive connections.
+
 Developer Eduardo Arana - info@arananet.net
 """
 
 import os
-import time
-import requests  # To call the local Ollama endpoint
-from langchain_community.llms import OpenAI
-from langchain_core.prompts import PromptTemplate
-from langchain.agents import Tool
-from langchain_openai import ChatOpenAI
-from dotenv import load_dotenv
-from colorama import Fore, Style, init
+import re
+import json
+import asyncio
+import hashlib
+import functools
+import importlib.util
+import threading
+from collections import deque
+import numpy as np
+import orjson  # Faster than the stdlib json decoder for the per-token chunks Ollama streams
+import httpx  # To call the local Ollama endpoint without blocking the event loop
+from aiolimiter import AsyncLimiter
+from colorama import Fore, Style
 from tqdm import tqdm
 
-# Initialize colorama
-init(autoreset=True)
+# The heavier LangChain integrations, sentence-transformers, dotenv and colorama's init are only
+# loaded when first needed (see get_llm, get_reasoning_chain, get_token_progress_handler
+# and __main__), keeping the import cheap.
+
+# Ollama serializes generation internally, so more than a handful of requests in flight only queues up.
+MAX_CONCURRENCY = 4
+
+# Rounds older than this are folded into a running summary instead of being re-sent verbatim,
+# so the reasoning prompt stops growing with every round.
+RECENT_ROUNDS = 2
+
+# OpenAI enforces requests-per-minute per usage tier; releasing calls at that rate keeps concurrent
+# reasoning requests at full throughput without running into 429s. Adjust to your tier.
+OPENAI_MAX_RPM = 500
+OPENAI_LIMITER = AsyncLimiter(max_rate=OPENAI_MAX_RPM, time_period=60)
+
+# One pooled HTTP/2 client per session, so rounds reuse open connections instead of paying a
+# TCP/TLS handshake per call. It is shared by the Ollama calls and the OpenAI client, and is opened
+# and closed by collaborative_session on its own event loop.
+# Connection failures are retried by the transport; 502/503/504 answers are retried with
+# exponential backoff in deepseek_r1_search_async. Connecting must be quick, generation may be slow.
+HTTP_TIMEOUT = httpx.Timeout(120, connect=3)
+HTTP_RETRIES = 3
+RETRY_BACKOFF = 0.2
+RETRY_STATUSES = {502, 503, 504}
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]").
+HTTP2 = importlib.util.find_spec("h2") is not None
 
-load_dotenv()
+
+def make_client() -> httpx.AsyncClient:
+    # Pool settings live on the transport, since httpx ignores client-level ones when one is passed.
+    transport = httpx.AsyncHTTPTransport(
+        http2=HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        retries=HTTP_RETRIES
+    )
+    return httpx.AsyncClient(timeout=HTTP_TIMEOUT, transport=transport)
+
+
+
+# -------------------------------------
+# Semantic response cache shared by both agents.
+#
+# Paraphrased queries (cosine similarity above the threshold) reuse an earlier answer instead of
+# paying for another round trip to Ollama or OpenAI. Identical text is answered from a hash lookup
+# before any embedding is computed. Entries live in memory only: DeepSeek results are not persisted
+# across runs, and only o3-mini completions are saved to disk, by the LLM cache in install_llm_cache.
+# -------------------------------------
+class SemanticCache:
+    def __init__(self, threshold: float = 0.90, model_name: str = "all-MiniLM-L6-v2"):
+        self.threshold = threshold
+        self.model_name = model_name
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._exact = {}
+        self._vectors = {}    # namespace -> (n, dim) array of normalized embeddings
+        self._responses = {}  # namespace -> list of responses aligned with the vectors
+
+    @staticmethod
+    def _key(text: str, namespace: str) -> str:
+        return hashlib.blake2b(f"{namespace}\0{text}".encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def namespace_for(*parts: str) -> str:
+        # Compact namespace for entries that must only match when every part is identical.
+        return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _embed(self, text: str) -> np.ndarray:
+        # Load the embedding model on first use so a cold start without cache traffic stays cheap.
+        with self._model_lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+                self._model = SentenceTransformer(self.model_name)
+        return self._model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    async def get(self, text: str, namespace: str = ""):
+        # Returns (response, vector). The vector is the embedding computed for the lookup, if any,
+        # so a miss can hand it to set() instead of embedding the same text twice.
+        hit = self._exact.get(self._key(text, namespace))
+        if hit is not None:
+            return hit, None
+        stored = self._vectors.get(namespace)
+        if stored is None:
+            return None, None
+        # Loading the model and encoding are CPU-bound; keep them off the event loop.
+        vector = await asyncio.to_thread(self._embed, text)
+        cos_sim = stored @ vector
+        best = int(np.argmax(cos_sim))
+        if cos_sim[best] > self.threshold:
+            return self._responses[namespace][best], vector
+        return None, vector
+
+    async def set(self, text: str, response, namespace: str = "", vector: np.ndarray = None):
+        self._exact[self._key(text, namespace)] = response
+        if vector is None:
+            vector = await asyncio.to_thread(self._embed, text)
+        stored = self._vectors.get(namespace)
+        row = vector[np.newaxis, :]
+        self._vectors[namespace] = row if stored is None else np.vstack([stored, row])
+        self._responses.setdefault(namespace, []).append(response)
+
+
+search_cache = SemanticCache()
+reasoning_cache = SemanticCache()
 
 
 # -------------------------------------
@@ -30,7 +138,13 @@ load_dotenv()
 # This function calls the local Ollama endpoint that wraps DeepSeek R1.
 # Modify the endpoint URL, headers, and payload as necessary.
 # -------------------------------------
-def deepseek_r1_search(query: str) -> str:
+async def deepseek_r1_search_async(query: str, client: httpx.AsyncClient = None) -> str:
+    if client is None:
+        # Called outside a session (e.g. through the Tool): use a client scoped to this call.
+        # Opening it first keeps the cache lookup below to a single pass.
+        async with make_client() as client:
+            return await deepseek_r1_search_async(query, client)
+
     # URL for your local Ollama instance that runs the DeepSeek R1 model
     ollama_url = "http://localhost:11434/api/generate"  # update to your configuration
 
@@ -38,29 +152,57 @@ def deepseek_r1_search(query: str) -> str:
     payload = {
         "model": "deepseek-r1:1.5b",
         "prompt": query,
-        "stream": False
+        "stream": True
     }
+    cached, vector = await search_cache.get(query)
+    if cached is not None:
+        print(f"{Fore.CYAN}[DeepSeek R1 via Ollama]{Style.RESET_ALL} Cache hit for query: {query}")
+        return cached
+
     try:
         print(f"{Fore.CYAN}[DeepSeek R1 via Ollama]{Style.RESET_ALL} Sending query: {query}")
-        with tqdm(total=100, desc="Waiting for DeepSeek R1 response", ncols=75) as pbar:
-            response = requests.post(ollama_url, json=payload)
-            for _ in range(100):
-                time.sleep(0.1)  # Simulate waiting time
-                pbar.update(1)
-            response.raise_for_status()  # Raise an error for bad responses
-            data = response.json()
-            # Depending on the API, adjust the way you get the result.
-            result = data.get("response", f"Default response for query '{query}'")
-    except Exception as e:
+        parts = []
+        for attempt in range(HTTP_RETRIES + 1):
+            # Ollama streams one JSON object per line; the bar advances with the characters actually received.
+            async with client.stream("POST", ollama_url, json=payload) as response:
+                if response.status_code in RETRY_STATUSES and attempt < HTTP_RETRIES:
+                    await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                    continue
+                response.raise_for_status()  # Raise an error for bad responses
+                with tqdm(desc="Receiving DeepSeek R1 response", ncols=75, unit="char") as pbar:
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        chunk = orjson.loads(line)
+                        # Depending on the API, adjust the way you get the result.
+                        token = chunk.get("response", "")
+                        parts.append(token)
+                        pbar.update(len(token))
+                        if chunk.get("done"):
+                            break
+                break
+        result = "".join(parts) or f"Default response for query '{query}'"
+        await search_cache.set(query, result, vector=vector)
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
         result = f"Error in DeepSeek R1 call: {e}"
     return result
 
+
+def deepseek_r1_search(query: str) -> str:
+    # Synchronous entry point for callers that are not running an event loop.
+    return asyncio.run(deepseek_r1_search_async(query))
+
 # Wrap the above function as a LangChain Tool
-deepseek_tool = Tool(
-    name="DeepSeek_Search",
-    func=deepseek_r1_search,
-    description="Query DeepSeek R1 (via a local Ollama instance) to retrieve relevant documents or information based on a search query."
-)
+@functools.lru_cache(maxsize=1)
+def get_deepseek_tool():
+    from langchain.agents import Tool
+
+    return Tool(
+        name="DeepSeek_Search",
+        func=deepseek_r1_search,
+        coroutine=deepseek_r1_search_async,
+        description="Query DeepSeek R1 (via a local Ollama instance) to retrieve relevant documents or information based on a search query."
+    )
 
 
 # -------------------------------------
@@ -68,12 +210,31 @@ deepseek_tool = Tool(
 #
 # Use a chat-oriented OpenAI model. (Make sure OPENAI_API_KEY is set in your environment.)
 # -------------------------------------
-openai_llm = ChatOpenAI(model_name="o3-mini")  # note: o3-mini does not support temperature parameter
+@functools.lru_cache(maxsize=1)
+def install_llm_cache():
+    from langchain_community.cache import SQLiteCache
+    from langchain_core.globals import set_llm_cache
+
+    # Persist exact-match completions across runs, keyed on (model, prompt, params), so rerunning a session
+    # with the same initial query answers round 1 from disk. For multi-worker setups swap in
+    # langchain_community.cache.RedisCache(redis_=Redis()).
+    set_llm_cache(SQLiteCache(database_path=".o3_cache.db"))
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm(client: httpx.AsyncClient):
+    # Built per session client, since the client's connections belong to that session's event loop.
+    from langchain_openai import ChatOpenAI
+
+    install_llm_cache()
+    # streaming=True makes .ainvoke() stream internally (reporting tokens to callbacks) while still
+    # consulting the LLM cache first, which .astream() would bypass.
+    return ChatOpenAI(model_name="o3-mini", streaming=True, http_async_client=client)  # note: o3-mini does not support temperature parameter
 
 # Define a prompt template for the reasoning agent.
 reasoning_template = """
 You are a collaborative reasoning agent. You will receive search results from DeepSeek R1 and the current state of the conversation.
-Your task is to analyze the provided information and suggest the next steps towards solving the problem.
+Your task is to analyze the provided information and decide which independent questions should be explored next towards solving the problem.
 
 Current conversation/context:
 {conversation_history}
@@ -81,18 +242,53 @@ Current conversation/context:
 DeepSeek result:
 {search_result}
 
-Based on the above, provide a next step, a plan, or a summative insight.
+Based on the above, reply ONLY with a JSON list of up to {max_queries} independent follow-up search queries,
+for example: ["first query", "second query"]
 Response:
 """
 
-reasoning_prompt = PromptTemplate(
-    input_variables=["conversation_history", "search_result"],
-    template=reasoning_template
-)
+@functools.lru_cache(maxsize=1)
+def get_reasoning_chain(client: httpx.AsyncClient):
+    from langchain_core.prompts import PromptTemplate
+
+    reasoning_prompt = PromptTemplate(
+        input_variables=["conversation_history", "search_result"],
+        partial_variables={"max_queries": str(MAX_CONCURRENCY)},
+        template=reasoning_template
+    )
+
+    # Instead of using LLMChain and its .run() method (which are deprecated),
+    # chain the prompt and LLM into a RunnableSequence.
+    return reasoning_prompt | get_llm(client)
+
+
+# Prompt used to fold a round that drops out of the recent window into the running summary.
+summary_template = """
+Condense the research conversation below into one compact paragraph.
+Keep every fact, open question and search query that may matter for later rounds.
+
+Summary so far:
+{prior}
+
+New round:
+{new}
+
+Updated summary:
+"""
+
+@functools.lru_cache(maxsize=1)
+def get_summary_chain(client: httpx.AsyncClient):
+    from langchain_core.prompts import PromptTemplate
+
+    summary_prompt = PromptTemplate(input_variables=["prior", "new"], template=summary_template)
+    return summary_prompt | get_llm(client)
 
-# Instead of using LLMChain and its .run() method (which are deprecated),
-# chain the prompt and LLM into a RunnableSequence.
-reasoning_chain = reasoning_prompt | openai_llm
+
+async def summarize_async(prior: str, new: str, client: httpx.AsyncClient) -> str:
+    # Identical (prior, new) pairs are answered by the SQLite LLM cache installed in get_llm.
+    async with OPENAI_LIMITER:
+        summary = await get_summary_chain(client).ainvoke({"prior": prior or "(none)", "new": new})
+    return summary.content.strip()
 
 
 # -------------------------------------
@@ -103,38 +299,187 @@ reasoning_chain = reasoning_prompt | openai_llm
 # – The reasoning agent (OpenAI) uses this information alongside the conversation history to suggest the next step.
 # The interaction continues for a defined number of rounds.
 # -------------------------------------
-def collaborative_session(initial_query: str, rounds: int = 2):
-    conversation_history = f"Initial query: {initial_query}"
-    current_query = initial_query
-
-    for i in range(rounds):
-        print(f"\n{Fore.YELLOW}=== Round {i+1} ==={Style.RESET_ALL}")
-
-        # 1. Retrieval stage: query DeepSeek R1 through Ollama.
-        retrieval_result = deepseek_r1_search(current_query)
-        print(f"{Fore.CYAN}DeepSeek R1 response:{Style.RESET_ALL} {retrieval_result}")
-
-        # 2. Reasoning stage: use OpenAI agent to process information.
-        reasoning_input = {
-            "conversation_history": conversation_history,
-            "search_result": retrieval_result
-        }
-        with tqdm(total=100, desc="Waiting for Reasoning Agent response", ncols=75) as pbar:
-            # Use .invoke() instead of .run()
-            reasoning_output = reasoning_chain.invoke(input=reasoning_input)
-            for _ in range(100):
-                time.sleep(0.1)  # Simulate waiting time
-                pbar.update(1)
-        print(f"{Fore.MAGENTA}O3-Mini agent output:{Style.RESET_ALL} {reasoning_output}")
-
-        # 3. Update conversation history.
-        conversation_history += f"\nRound {i+1}:\nSearch query: {current_query}\nDeepSeek result: {retrieval_result}\nReasoning: {reasoning_output}\n"
-
-        # 4. Optionally, use the reasoning output as a basis for the next search query.
-        current_query = reasoning_output.content.strip()
-
-        time.sleep(1)  # Optionally pause between rounds.
+def parse_next_queries(content: str) -> list:
+    # The reasoning agent is asked for a JSON list, but may wrap it in a code fence or prose.
+    # Only a list (or a bare string) is trusted; anything else falls back to the raw text.
+    content = content.strip()
+    start, end = content.find("["), content.rfind("]")
+    candidate = content[start:end + 1] if 0 <= start < end else content
+    try:
+        queries = json.loads(candidate)
+    except json.JSONDecodeError:
+        queries = [content]
+    if isinstance(queries, str):
+        queries = [queries]
+    elif not isinstance(queries, list):
+        queries = [content]
+    cleaned = [q.strip() for q in queries if isinstance(q, str) and q.strip()]
+    return list(dict.fromkeys(cleaned))[:MAX_CONCURRENCY]
+
+
+# A complete JSON string literal, as emitted inside the reasoning agent's list of queries.
+JSON_STRING = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
+
+@functools.lru_cache(maxsize=1)
+def get_token_progress_handler():
+    from langchain_core.callbacks import AsyncCallbackHandler
+
+    class TokenProgressHandler(AsyncCallbackHandler):
+        # Advances a tqdm bar for every token streamed by the LLM. When on_query is given, every
+        # JSON string literal completed so far is reported once, so follow-up searches can start
+        # before the reasoning agent has finished its answer.
+        def __init__(self, pbar, on_query=None):
+            self.pbar = pbar
+            self.on_query = on_query
+            self._buffer = []
+            self._seen = 0
+
+        async def on_llm_new_token(self, token: str, **kwargs):
+            self.pbar.update(1)
+            self._buffer.append(token)
+            # A literal can only complete on a token that contains its closing quote.
+            if self.on_query is None or '"' not in token:
+                return
+            literals = JSON_STRING.findall("".join(self._buffer))
+            for literal in literals[self._seen:]:
+                try:
+                    query = json.loads(f'"{literal}"').strip()
+                except json.JSONDecodeError:
+                    continue
+                if query:
+                    self.on_query(query)
+            self._seen = len(literals)
+
+    return TokenProgressHandler
+
+
+async def reason_async(query: str, conversation_history: str, search_result: str,
+                       client: httpx.AsyncClient, on_query=None):
+    # The conversation history and the query must match exactly, while the search result is
+    # compared semantically. Scoping by query keeps results of different queries in one round,
+    # which often share a near-identical <think> preamble, from answering for each other.
+    namespace = SemanticCache.namespace_for(query, conversation_history)
+    cached, vector = await reasoning_cache.get(search_result, namespace)
+    if cached is not None:
+        return cached
+
+    reasoning_input = {
+        "conversation_history": conversation_history,
+        "search_result": search_result
+    }
+    # The progress bar follows the tokens o3-mini actually sends back.
+    async with OPENAI_LIMITER:
+        with tqdm(desc="Receiving Reasoning Agent response", ncols=75, unit="token") as pbar:
+            reasoning_output = await get_reasoning_chain(client).ainvoke(
+                reasoning_input,
+                config={"callbacks": [get_token_progress_handler()(pbar, on_query)]}
+            )
+    await reasoning_cache.set(search_result, reasoning_output, namespace, vector)
+    return reasoning_output
 
+
+async def bounded_search(query: str, semaphore: asyncio.Semaphore, client: httpx.AsyncClient) -> str:
+    # The semaphore caps how many queries hit Ollama at once.
+    async with semaphore:
+        return await deepseek_r1_search_async(query, client)
+
+
+async def explore(query: str, conversation_history: str, semaphore: asyncio.Semaphore,
+                  client: httpx.AsyncClient, prefetched: asyncio.Task = None, on_query=None):
+    # Reasoning about a result starts as soon as its own search finishes, instead of waiting for
+    # every other query of the round. A search speculatively started last round is reused.
+    if prefetched is not None:
+        retrieval_result = await prefetched
+    else:
+        retrieval_result = await bounded_search(query, semaphore, client)
+    print(f"{Fore.CYAN}DeepSeek R1 response to '{query}':{Style.RESET_ALL} {retrieval_result}")
+    reasoning_output = await reason_async(query, conversation_history, retrieval_result, client, on_query)
+    print(f"{Fore.MAGENTA}O3-Mini agent output:{Style.RESET_ALL} {reasoning_output.content}")
+    return retrieval_result, reasoning_output
+
+
+async def collaborative_session(initial_query: str, rounds: int = 2):
+    # Collect history fragments in a list and join them when needed, instead of growing one string.
+    history_parts = [f"Initial query: {initial_query}"]
+    # The reasoning agent only sees the last few rounds verbatim plus a summary of everything earlier.
+    recent = deque(maxlen=RECENT_ROUNDS)
+    summary = ""
+    queries = [initial_query]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    # Searches for next-round queries, started while the reasoning agent is still streaming.
+    prefetched = {}
+
+    # The pooled client lives exactly as long as the session, on the loop that runs it.
+    async with make_client() as client:
+        try:
+            async with asyncio.TaskGroup() as tg:
+                def prefetch(query):
+                    if query not in prefetched and len(prefetched) < MAX_CONCURRENCY:
+                        prefetched[query] = tg.create_task(bounded_search(query, semaphore, client))
+
+                for i in range(rounds):
+                    print(f"\n{Fore.YELLOW}=== Round {i+1} ==={Style.RESET_ALL}")
+                    # Nothing follows the last round, so there is nothing to prefetch for.
+                    on_query = prefetch if i + 1 < rounds else None
+
+                    # The oldest recent round drops out of the window after this round. Fold it into the
+                    # summary now, so the summarizer overlaps this round's retrieval and reasoning.
+                    # Skipped in the last round, since no further prompt would use it.
+                    summary_task = None
+                    if len(recent) == recent.maxlen and i + 1 < rounds:
+                        summary_task = tg.create_task(summarize_async(summary, recent[0], client))
+
+                    # 1. Retrieval stage: query DeepSeek R1 through Ollama, one request per independent query.
+                    # 2. Reasoning stage: the OpenAI agent processes each result as soon as it arrives.
+                    context_parts = [history_parts[0]]
+                    if summary:
+                        context_parts.append(f"Summary of earlier rounds:\n{summary}")
+                    context_parts.append("Recent rounds:")
+                    context_parts.extend(recent)
+                    conversation_history = "\n".join(context_parts)
+                    # Each query runs as a TaskGroup child: if one fails, its siblings are cancelled
+                    # before the session's client is closed. asyncio.wait never raises itself, so a
+                    # failure surfaces once, through the TaskGroup.
+                    explore_tasks = [
+                        tg.create_task(explore(q, conversation_history, semaphore, client, prefetched.pop(q, None), on_query))
+                        for q in queries
+                    ]
+                    await asyncio.wait(explore_tasks)
+                    explored = [task.result() for task in explore_tasks]
+                    retrieval_results = [retrieval_result for retrieval_result, _ in explored]
+                    reasoning_outputs = [reasoning_output for _, reasoning_output in explored]
+
+                    # 3. Update conversation history.
+                    round_parts = [f"\nRound {i+1}:"]
+                    for query, retrieval_result, reasoning_output in zip(queries, retrieval_results, reasoning_outputs):
+                        round_parts.append(f"Search query: {query}\nDeepSeek result: {retrieval_result}\nReasoning: {reasoning_output.content}")
+                    round_text = "\n".join(round_parts)
+                    history_parts.append(round_text)
+                    # The next prompt needs the updated summary before the round it folded is dropped.
+                    if summary_task is not None:
+                        await asyncio.wait([summary_task])
+                        summary = summary_task.result()
+                    recent.append(round_text)
+
+                    # 4. Use the follow-up queries proposed by the reasoning agent as the next round's searches.
+                    next_queries = []
+                    for reasoning_output in reasoning_outputs:
+                        next_queries.extend(parse_next_queries(reasoning_output.content.strip()))
+                    queries = list(dict.fromkeys(next_queries))[:MAX_CONCURRENCY] or queries
+
+                    # Discard speculative searches for queries that did not make the final list. Paraphrases
+                    # that did finish are still picked up through the semantic search cache.
+                    for query in [q for q in prefetched if q not in queries]:
+                        prefetched.pop(query).cancel()
+        except BaseExceptionGroup as group:
+            # The TaskGroup wraps any failure in an ExceptionGroup; re-raise a lone error as-is so
+            # callers can keep catching e.g. openai.APIError or httpx.HTTPError directly.
+            if len(group.exceptions) == 1:
+                raise group.exceptions[0]
+            raise
+
+    conversation_history = "\n".join(history_parts)
     print(f"\n{Fore.GREEN}--- Final conversation history ---{Style.RESET_ALL}")
     print(conversation_history)
     return conversation_history
@@ -144,7 +489,16 @@ def collaborative_session(initial_query: str, rounds: int = 2):
 # Main entry point for testing.
 # -------------------------------------
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+    from colorama import init
+
+    # Initialize colorama
+    init(autoreset=True)
+
+    load_dotenv()
+
     # Ensure that your OpenAI API key is set in your .env file:
     # OPENAI_API_KEY=
     test_query = "What are the latest advancements in natural language processing?"
-    collaborative_session(initial_query=test_query, rounds=3)
+
+    asyncio.run(collaborative_session(initial_query=test_query, rounds=3))
@@ -17,11 +17,12 @@ Required assets (optional):
 
 If the image files are not present, the game will display simple shapes.
   
-Make sure pygame is installed (pip install pygame).
+Make sure pygame and numpy are installed (pip install pygame numpy).
 Run with: python pong_game.py
 """
 
-import pygame, sys, os, random
+import pygame, sys, os, random, array
+import numpy as np
 
 pygame.init()
 
@@ -31,8 +32,16 @@ pygame.init()
 SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
 FPS = 60
 
+# Physics runs in fixed steps independent of the render rate. Speeds below are
+# in pixels per step, so the step matches the original 60 Hz frame timing.
+PHYSICS_HZ = 60
+FIXED_DT = 1000 / PHYSICS_HZ        # milliseconds per physics step
+MAX_FRAME_TIME = 250                # clamp long stalls so physics never spirals
+
 PADDLE_WIDTH, PADDLE_HEIGHT = 20, 100
 BALL_SIZE = 20
+BALL_SPEED = 7
+BALL_COUNT = 1
 
 PLAYER_SPEED = 7
 # Computer paddle speed. (The computer will “track” the ball but, if you wish, you can add slight delay.)
@@ -40,6 +49,20 @@ COMP_SPEED = 6
 
 STARTING_LIVES = 3
 
+# Key codes cached at module scope for the per-frame input lookup.
+K_UP, K_DOWN = pygame.K_UP, pygame.K_DOWN
+
+# Precomputed ±1 jitter table. Hits and resets read it through a rolling index
+# instead of building a list and calling random.choice every time.
+JITTER_SIZE = 1024  # must be a power of two
+JITTER = array.array('b', [random.choice((-1, 1)) for _ in range(JITTER_SIZE)])
+jitter_index = 0
+
+def next_jitter():
+    global jitter_index
+    jitter_index = (jitter_index + 1) & (JITTER_SIZE - 1)
+    return JITTER[jitter_index]
+
 # Colors (for fallback drawing)
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -58,6 +81,38 @@ clock = pygame.time.Clock()
 # --------------
 font = pygame.font.SysFont(None, 36)
 
+# Static HUD labels and the glyphs 0-9 are rasterized once; the HUD is then
+# assembled from these cached pieces instead of re-rendering the whole string.
+# Numbers of any size are composed digit by digit.
+HUD_LABELS = {key: font.render(text, True, WHITE) for key, text in {
+    "player": "Player: ",
+    "lives": "   Lives: ",
+    "separator": "    |    ",
+    "computer": "Computer: ",
+}.items()}
+DIGIT_CACHE = {char: font.render(char, True, WHITE) for char in "0123456789-"}
+
+def number_glyphs(n):
+    return [DIGIT_CACHE[char] for char in str(n)]
+
+def build_hud(player_score, player_lives, comp_score, comp_lives):
+    pieces = [
+        HUD_LABELS["player"], *number_glyphs(player_score),
+        HUD_LABELS["lives"], *number_glyphs(player_lives),
+        HUD_LABELS["separator"],
+        HUD_LABELS["computer"], *number_glyphs(comp_score),
+        HUD_LABELS["lives"], *number_glyphs(comp_lives),
+    ]
+    width = sum(piece.get_width() for piece in pieces)
+    height = max(piece.get_height() for piece in pieces)
+    hud = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha(screen)
+    hud.fill((0, 0, 0, 0))
+    x = 0
+    for piece in pieces:
+        hud.blit(piece, (x, 0))
+        x += piece.get_width()
+    return hud
+
 # --------------
 # Helper function to load an image with fallback.
 # --------------
@@ -65,11 +120,16 @@ def load_sprite(image_name, fallback_size, fill_color):
     fullpath = os.path.join(os.path.dirname(__file__), image_name)
     try:
         image = pygame.image.load(fullpath)
-        image = image.convert_alpha()
     except Exception as e:
         # If image loading fails, return a Surface filled with color.
         image = pygame.Surface(fallback_size)
         image.fill(fill_color)
+    # Match the display's pixel format once here so per-frame blits need no conversion.
+    # Only keep a per-pixel alpha channel when the image actually has one.
+    if image.get_flags() & pygame.SRCALPHA:
+        image = image.convert_alpha(screen)
+    else:
+        image = image.convert(screen)
     return image
 
 # --------------
@@ -87,61 +147,68 @@ class Paddle(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
+        # Lowest y the paddle may reach, computed once instead of every frame.
+        self._max_y = SCREEN_HEIGHT - self.rect.height
         
     def update(self, dy):
-        self.rect.y += dy
-        # Keep paddle within vertical boundaries.
-        if self.rect.top < 0:
-            self.rect.top = 0
-        if self.rect.bottom > SCREEN_HEIGHT:
-            self.rect.bottom = SCREEN_HEIGHT
+        # Move and keep paddle within vertical boundaries in a single clamp.
+        self.rect.y = max(0, min(self._max_y, self.rect.y + dy))
 
 # --------------
-# Ball Sprite Class
+# Balls (structure of arrays)
 # --------------
-class Ball(pygame.sprite.Sprite):
-    def __init__(self):
-        super().__init__()
-        self.image = load_sprite("ball.png", (BALL_SIZE, BALL_SIZE), WHITE)
-        self.rect = self.image.get_rect()
-        self.reset()
+# Every ball is one row of an int32 array with columns x, y, speed_x, speed_y,
+# so movement and collisions are a few NumPy operations regardless of count.
+BX, BY, VX, VY = range(4)
+
+ball_image = load_sprite("ball.png", (BALL_SIZE, BALL_SIZE), WHITE)
+BALL_W, BALL_H = ball_image.get_size()
+BALL_MAX_Y = SCREEN_HEIGHT - BALL_H
+
+def reset_balls(balls, mask):
+    # Place the selected balls in the center with a random initial direction.
+    count = int(mask.sum())
+    balls[mask, BX] = SCREEN_WIDTH//2 - BALL_W//2
+    balls[mask, BY] = SCREEN_HEIGHT//2 - BALL_H//2
+    balls[mask, VX] = [BALL_SPEED * next_jitter() for _ in range(count)]
+    balls[mask, VY] = [BALL_SPEED * next_jitter() for _ in range(count)]
+
+def paddle_hits(balls, rect):
+    # Vectorized equivalent of Rect.colliderect for every ball against one paddle.
+    return ((balls[:, BX] < rect.right) & (balls[:, BX] + BALL_W > rect.left) &
+            (balls[:, BY] < rect.bottom) & (balls[:, BY] + BALL_H > rect.top))
+
+def update_balls(balls):
+    balls[:, BX] += balls[:, VX]
+    balls[:, BY] += balls[:, VY]
     
-    def reset(self):
-        # Place ball in center.
-        self.rect.center = (SCREEN_WIDTH//2, SCREEN_HEIGHT//2)
-        # Randomize initial direction.
-        dir_x = random.choice([-1, 1])
-        dir_y = random.choice([-1, 1])
-        self.speed_x = 7 * dir_x
-        self.speed_y = 7 * dir_y
-        
-    def update(self):
-        self.rect.x += self.speed_x
-        self.rect.y += self.speed_y
-        
-        # Bounce off top and bottom.
-        if self.rect.top <= 0 or self.rect.bottom >= SCREEN_HEIGHT:
-            self.speed_y *= -1
+    # Bounce off top and bottom.
+    bounce = (balls[:, BY] <= 0) | (balls[:, BY] >= BALL_MAX_Y)
+    balls[bounce, VY] = -balls[bounce, VY]
+
+def deflect(balls, hit):
+    # Reverse horizontal direction and add a slight random variation for challenge.
+    count = int(hit.sum())
+    if count:
+        balls[hit, VX] = -balls[hit, VX]
+        balls[hit, VY] += np.array([next_jitter() for _ in range(count)], dtype=np.int32)
 
 # --------------
 # Create sprite groups
 # --------------
-all_sprites = pygame.sprite.Group()
 paddle_group = pygame.sprite.Group()
 
 # Create player paddle – placed at left side.
 player_paddle = Paddle(30, SCREEN_HEIGHT//2 - PADDLE_HEIGHT//2, is_player=True)
 paddle_group.add(player_paddle)
-all_sprites.add(player_paddle)
 
 # Create computer paddle – placed at right side.
 comp_paddle = Paddle(SCREEN_WIDTH - 30 - PADDLE_WIDTH, SCREEN_HEIGHT//2 - PADDLE_HEIGHT//2, is_player=False)
 paddle_group.add(comp_paddle)
-all_sprites.add(comp_paddle)
 
-# Create ball.
-ball = Ball()
-all_sprites.add(ball)
+# Create balls.
+balls = np.zeros((BALL_COUNT, 4), dtype=np.int32)
+reset_balls(balls, np.ones(BALL_COUNT, dtype=bool))
 
 # --------------
 # Game Variables (score & lives)
@@ -151,12 +218,18 @@ player_lives = STARTING_LIVES
 comp_score = 0
 comp_lives = STARTING_LIVES
 
+# The HUD surface is only rebuilt when one of its numbers changes.
+hud_state = None
+hud_surface = None
+
 # --------------
 # Main Game Loop
 # --------------
+accumulator = 0.0
 running = True
 while running:
-    clock.tick(FPS)
+    # tick_busy_loop spins on the high-resolution timer instead of oversleeping in SDL_Delay.
+    accumulator += min(clock.tick_busy_loop(FPS), MAX_FRAME_TIME)
     
     # --- Event Processing ---
     for event in pygame.event.get():
@@ -164,61 +237,59 @@ while running:
             running = False
     
     # --- Player Input (Up/Down keys) ---
+    # Pressed keys read as 0/1, so the direction is a single subtraction.
     keys = pygame.key.get_pressed()
-    dy = 0
-    if keys[pygame.K_UP]:
-        dy = -PLAYER_SPEED
-    if keys[pygame.K_DOWN]:
-        dy = PLAYER_SPEED
-    player_paddle.update(dy)
-    
-    # --- Computer Paddle AI ---
-    # A simple strategy: move the computer paddle toward the ball.
-    if ball.rect.centery < comp_paddle.rect.centery:
-        comp_paddle.update(-COMP_SPEED)
-    elif ball.rect.centery > comp_paddle.rect.centery:
-        comp_paddle.update(COMP_SPEED)
+    dy = (keys[K_DOWN] - keys[K_UP]) * PLAYER_SPEED
     
-    # --- Update Ball Position ---
-    ball.update()
-    
-    # --- Check for Collisions with Paddles ---
-    # If the ball hits the paddles, reverse its horizontal direction.
-    if ball.rect.colliderect(player_paddle.rect) and ball.speed_x < 0:
-        ball.speed_x *= -1
-        # Optionally add a slight random variation for challenge.
-        ball.speed_y += random.choice([-1, 1])
+    # --- Fixed-step Physics ---
+    while accumulator >= FIXED_DT and running:
+        accumulator -= FIXED_DT
+        player_paddle.update(dy)
         
-    if ball.rect.colliderect(comp_paddle.rect) and ball.speed_x > 0:
-        ball.speed_x *= -1
-        ball.speed_y += random.choice([-1, 1])
-    
-    # --- Check if Ball Went Off-Screen ---
-    # If the ball leaves the left side, the player loses a life and computer gains a point.
-    if ball.rect.right < 0:
-        comp_score += 1
-        player_lives -= 1
-        ball.reset()
+        # --- Computer Paddle AI ---
+        # A simple strategy: move the computer paddle toward the ball closest to its side.
+        ball_y = int(balls[balls[:, BX].argmax(), BY]) + BALL_H//2
+        comp_y = comp_paddle.rect.centery
+        dy_c = ((ball_y > comp_y) - (ball_y < comp_y)) * COMP_SPEED
+        comp_paddle.update(dy_c)
         
-    # If the ball leaves the right side, the computer loses a life and the player gains a point.
-    if ball.rect.left > SCREEN_WIDTH:
-        player_score += 1
-        comp_lives -= 1
-        ball.reset()
-    
-    # --- Check for Game Over ---
-    if player_lives <= 0 or comp_lives <= 0:
-        running = False  # End the game loop.
+        # --- Update Ball Positions ---
+        update_balls(balls)
+        
+        # --- Check for Collisions with Paddles ---
+        # If a ball hits a paddle while moving towards it, reverse its horizontal direction.
+        deflect(balls, paddle_hits(balls, player_paddle.rect) & (balls[:, VX] < 0))
+        deflect(balls, paddle_hits(balls, comp_paddle.rect) & (balls[:, VX] > 0))
+        
+        # --- Check if Balls Went Off-Screen ---
+        # If a ball leaves the left side, the player loses a life and computer gains a point.
+        missed_left = balls[:, BX] + BALL_W < 0
+        # If a ball leaves the right side, the computer loses a life and the player gains a point.
+        missed_right = balls[:, BX] > SCREEN_WIDTH
+        if missed_left.any() or missed_right.any():
+            comp_score += int(missed_left.sum())
+            player_lives = max(0, player_lives - int(missed_left.sum()))
+            player_score += int(missed_right.sum())
+            comp_lives = max(0, comp_lives - int(missed_right.sum()))
+            reset_balls(balls, missed_left | missed_right)
+        
+        # --- Check for Game Over ---
+        if player_lives <= 0 or comp_lives <= 0:
+            running = False  # End the game loop.
     
     # --- Drawing ---
     screen.fill(BLACK)
     
-    # Draw all sprites.
-    all_sprites.draw(screen)
+    # Draw the paddles, then each ball offset by the fraction of a step not yet simulated.
+    paddle_group.draw(screen)
+    alpha = accumulator / FIXED_DT
+    for x, y, speed_x, speed_y in balls.tolist():
+        screen.blit(ball_image, (x + speed_x * alpha, y + speed_y * alpha))
     
     # Draw HUD (Score and Lives) at the top.
-    hud_text = f"Player: {player_score}   Lives: {player_lives}    |    Computer: {comp_score}   Lives: {comp_lives}"
-    hud_surface = font.render(hud_text, True, WHITE)
+    if hud_state != (player_score, player_lives, comp_score, comp_lives):
+        hud_state = (player_score, player_lives, comp_score, comp_lives)
+        hud_surface = build_hud(*hud_state)
     screen.blit(hud_surface, (20, 20))
     
     pygame.display.flip()